@@ -10,7 +10,7 @@ First, we want to implement the simulation engine.
 Parallelization and automatic differentiation are abstracted
 away from the user, which can focus on implementing single-voxel
 simulation.
-    
+
 """
 
 # %%
@@ -88,10 +88,8 @@ class SSFPMRFModel(base.AbstractModel):
             # Record signal
             signal.append(epg.get_signal(states))
 
-            # Evolve
-            states = epg.longitudinal_relaxation(states, E1, rE1)
-            states = epg.transverse_relaxation(states, E2)
-            states = epg.shift(states)
+            # Evolve (relaxation, recovery and dephasing in a single pass)
+            states = epg.evolve(states, E1, rE1, E2)
 
         return torch.stack(signal)
 
@@ -7,7 +7,7 @@ This example shows how to use TorchSim to generate synthetic data.
 
 We will use torchio and sigpy to get realistic ground truth maps and
 coil sensitivities. These can be installed as:
-    
+
 ``pip install torchio``
 ``pip install sigpy``
 
@@ -141,9 +141,10 @@ def generate_synth_data(M0, T2, flip, ESP, phases=None, ncoils=8, device="cpu"):
     echo_series = M0 * simulate(T2, flip, ESP, device=device)
     smaps = smri.birdcage_maps((ncoils, *echo_series.shape[1:]))
     echo_series = smaps[:, None, ...] * echo_series
-    mask = np.stack(
-        [smri.poisson(T2.shape, len(flip)) for n in range(len(flip))], axis=0
-    )
+
+    # Poisson mask is seeded, hence identical for every echo: build it once
+    mask = smri.poisson(T2.shape, len(flip))
+
     return mask * sp.fft(echo_series, axes=range(-2, 0))
 
 
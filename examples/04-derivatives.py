@@ -97,7 +97,7 @@ def crlb_cost(flip, ESP, T1, T2):
     _cost = partial(_crlb_cost, ESP, T1, T2)
     _dcost = jacrev(_cost)
 
-    return _cost(flip).detach().cpu().numpy(), _dcost(flip).detach().cpu().numpy()
+    return _cost(flip).numpy(force=True), _dcost(flip).numpy(force=True)
 
 
 # %%
@@ -124,7 +124,7 @@ def _crlb_finitediff_cost(ESP, T1, T2, flip):
     _, grad = fse_finitediff_grad(flip, ESP, T1, T2)
 
     # calculate cost
-    return calculate_crlb(grad).cpu().detach().numpy()
+    return calculate_crlb(grad).numpy(force=True)
 
 
 def crlb_finitediff_cost(flip, ESP, T1, T2):
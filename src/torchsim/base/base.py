@@ -2,6 +2,7 @@
 
 __all__ = ["AbstractModel"]
 
+import functools
 import inspect
 
 from abc import ABC, abstractmethod
@@ -43,13 +44,30 @@ class AbstractModel(ABC):
         self.device = device
         self.diff = diff
 
-        # Extract broadcastable parameters
-        self.broadcastable_params = list(
-            inspect.signature(self.set_properties).parameters.keys()
-        )
+        # Get broadcastable parameters
+        self.broadcastable_params = list(self._broadcastable_params)
+
+        # Map diff parameter names to engine positional argument indexes
+        if diff is not None:
+            self.argnums = _get_argnums(diff, self.broadcastable_params)
+        else:
+            self.argnums = None
+
         self.properties = SimpleNamespace()
         self.sequence = SimpleNamespace()
 
+        # Engines built for the last sequence, reused across calls
+        self._engines_key = None
+        self._engines = None
+        self._engines_params = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Extract broadcastable parameters once per model class (skip ``self``)
+        parameters = inspect.signature(cls.set_properties).parameters
+        cls._broadcastable_params = tuple(parameters.keys())[1:]
+
     @autocast
     @abstractmethod
     def set_properties(self, *args, **kwargs):
@@ -102,22 +120,13 @@ class AbstractModel(ABC):
             Captured non-broadcastable parameters.
 
         """
-        # Get the engine's signature
-        signature = inspect.signature(_func)
-
-        # Extract default values for all parameters
-        default_args = {}
-        for k, v in signature.parameters.items():
-            if v.default is not inspect.Parameter.empty:
-                default_args[k] = v.default
-            else:
-                default_args[k] = None
+        # Get the engine's parameter names and default values
+        parameter_names, default_args = _get_defaults(_func)
 
         # Merge default values and user-provided keyword arguments
         merged_kwargs = {**default_args, **kwargs}
 
         # Replace first `len(user_args)` items with positional arguments
-        parameter_names = list(signature.parameters.keys())
         for idx, arg in enumerate(args):
             merged_kwargs[parameter_names[idx]] = arg
 
@@ -135,15 +144,9 @@ class AbstractModel(ABC):
             # Call the original engine
             return _func(**combined_args)
 
-        # Get argnums for diff
-        if self.diff is not None:
-            argnums = _get_argnums(self.diff, self.broadcastable_params)
-        else:
-            argnums = None
-
-        return func, argnums
+        return func, self.argnums
 
-    def _forward(self, *args, **kwargs):
+    def _forward(self, *args, compile: bool | str = False, **kwargs):
         """
         Return a callable for forward computation. Useful for sequence optimization.
 
@@ -151,6 +154,11 @@ class AbstractModel(ABC):
         ----------
         *args : Any
             Positional arguments for the simulation.
+        compile : bool | str, optional
+            Compile the vectorized engine using ``torch.compile``.
+            If a string, it is used as compilation ``mode`` (e.g.,
+            ``"reduce-overhead"`` to replay the pulse train as a CUDA graph).
+            The default is ``False``.
         **kwargs : Any
             Keyword arguments for the simulation.
 
@@ -162,14 +170,16 @@ class AbstractModel(ABC):
         """
         engine, _ = self._get_func(self._engine, *args, **kwargs)
 
-        def vmapped_engine(*inputs):
-            vmapped = torch.vmap(engine, chunk_size=self.chunk_size)
-            broadcast_vmapped = broadcast(vmapped)
-            return broadcast_vmapped(*inputs)
+        # Vectorize single-atom engine over the leading (broadcasted) atom axis
+        vmapped_engine = _vmap(engine, chunk_size=self.chunk_size)
+
+        # Compile the numerical kernel only, leaving argument handling eager;
+        # sequence shapes are fixed for a given model, so specialize on them
+        vmapped_engine = _compile(vmapped_engine, compile)
 
-        return vmapped_engine
+        return broadcast(vmapped_engine)
 
-    def _jacobian(self, *args, **kwargs):
+    def _jacobian(self, *args, compile: bool | str = False, **kwargs):
         """
         Return a callable for the Jacobian computation. Useful for sequence optimization.
 
@@ -177,6 +187,11 @@ class AbstractModel(ABC):
         ----------
         *args : Any
             Positional arguments for the simulation.
+        compile : bool | str, optional
+            Compile the vectorized jacobian engine using ``torch.compile``.
+            If a string, it is used as compilation ``mode`` (e.g.,
+            ``"reduce-overhead"`` to replay the pulse train as a CUDA graph).
+            The default is ``False``.
         **kwargs : Any
             Keyword arguments for the simulation.
 
@@ -188,24 +203,23 @@ class AbstractModel(ABC):
         """
         if self.diff is None:
             return None
-        if _is_implemented(self._jacobian_engine):
-            jac_engine, argnums = self._get_func(self._jacobian_engine, *args, **kwargs)
-
-            def jacobian_engine(*inputs):
-                vmapped_jac = torch.vmap(jac_engine, chunk_size=self.chunk_size)
-                broadcast_vmapped_jac = broadcast(vmapped_jac)
-                return broadcast_vmapped_jac(*inputs)
-
+        # Use manual jacobian engine if the subclass overrides it
+        if type(self)._jacobian_engine is not AbstractModel._jacobian_engine:
+            jac_engine, _ = self._get_func(self._jacobian_engine, *args, **kwargs)
         else:
             engine, argnums = self._get_func(self._engine, *args, **kwargs)
 
-            def jacobian_engine(*inputs):
-                jac_engine = jacfwd(argnums=argnums)(engine)
-                vmapped_jac = torch.vmap(jac_engine, chunk_size=self.chunk_size)
-                broadcast_vmapped_jac = broadcast(vmapped_jac)
-                return broadcast_vmapped_jac(*inputs)
+            # Forward-mode AD: few tissue parameters, many signal samples
+            jac_engine = jacfwd(argnums=argnums)(engine)
+
+        # Vectorize single-atom jacobian over the leading (broadcasted) atom axis
+        vmapped_jac = _vmap(jac_engine, chunk_size=self.chunk_size)
+
+        # Compile the numerical kernel only, leaving argument handling eager;
+        # sequence shapes are fixed for a given model, so specialize on them
+        vmapped_jac = _compile(vmapped_jac, compile)
 
-        return jacobian_engine
+        return broadcast(vmapped_jac)
 
     def __call__(self):
         """
@@ -229,45 +243,55 @@ class AbstractModel(ABC):
         else:
             device = self.device
 
-        # Force device
-        for k in kwargs.keys():
-            if isinstance(kwargs[k], torch.Tensor):
-                kwargs[k] = kwargs[k].to(device)
-
-        # Split broadcastable and non-broadcastable params
-        broadcastable_kwargs = {
-            k: v for k, v in kwargs.items() if k in self.broadcastable_params
-        }
-        non_broadcastable_kwargs = {
-            k: v for k, v in kwargs.items() if k not in self.broadcastable_params
-        }
-
-        # Get forward function
-        forward_fn = self._forward(**non_broadcastable_kwargs)
+        # Split broadcastable (in engine positional order) and non-broadcastable
+        # params, forcing device on the former
+        broadcastable_args = []
+        for k in self.broadcastable_params:
+            broadcastable_args.append(_to_device(kwargs.pop(k), device))
+
+        # Get forward and jacobian functions, rebuilding them (and transferring
+        # the sequence to device) only if the sequence changed. Original params
+        # are kept alive with the engines, so their ids are unique
+        key = (device, tuple((k, id(v)) for k, v in kwargs.items()))
+        if key != self._engines_key:
+            non_broadcastable_kwargs = {
+                k: _to_device(v, device) for k, v in kwargs.items()
+            }
+            self._engines = (
+                self._forward(**non_broadcastable_kwargs),
+                self._jacobian(**non_broadcastable_kwargs),
+            )
+            self._engines_key = key
+            self._engines_params = kwargs
+        forward_fn, jacobian_fn = self._engines
 
         # If no derivative is requested, run forward with explicit `no_grad()` for performance
         if self.diff is None:
             with torch.no_grad():
-                output = forward_fn(*broadcastable_kwargs.values())
+                output = forward_fn(*broadcastable_args)
             return output
 
         # Run forward pass
-        output = forward_fn(*broadcastable_kwargs.values())
+        output = forward_fn(*broadcastable_args)
 
-        # Get derivative and run
-        jacobian_fn = self._jacobian(**non_broadcastable_kwargs)
-        jacobian_output = jacobian_fn(*broadcastable_kwargs.values())
+        # Run derivative
+        jacobian_output = jacobian_fn(*broadcastable_args)
 
         return output, jacobian_output
 
-    def forward(self, compile: bool = False) -> Callable:
+    def forward(self, compile: bool | str = False) -> Callable:
         """
         Get forward method.
 
         Parameters
         ----------
-        compile : bool, optional
+        compile : bool | str, optional
             Compile function using ``torch.compile``. The default is ``False``.
+            If a string, it is used as compilation ``mode`` (e.g.,
+            ``"reduce-overhead"`` to replay the pulse train as a CUDA graph).
+            Compiled kernels are cached on disk by TorchInductor, hence the
+            compilation cost is paid once across processes; set
+            ``TORCHINDUCTOR_CACHE_DIR`` to persist the cache (e.g., on CI).
 
         Returns
         -------
@@ -281,60 +305,36 @@ class AbstractModel(ABC):
             k: v for k, v in _kwargs.items() if k not in self.broadcastable_params
         }
 
-        _forward_fn = self._forward(**non_broadcastable_kwargs)
-
-        # Update the signature of the forward_fn
-        # Extract the signature of `_engine`
-        engine_sig = inspect.signature(self._engine)
-        forward_sig = inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    name=param_name,
-                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    default=engine_sig.parameters[param_name].default,
-                )
-                for param_name in self.broadcastable_params
-            ]
+        _forward_fn = self._forward(compile=compile, **non_broadcastable_kwargs)
+
+        # Get broadcastable signature of `_engine` and its default values
+        forward_sig, defaults = _get_signature(
+            self._engine, tuple(self.broadcastable_params)
         )
 
         def forward_fn(*args, **kwargs):
-            # Get number of arguments
-            n_args = len(args)
-
-            # Create a dictionary of keyword arguments and their default values
-            _kwargs = {}
-            for k, v in forward_sig.parameters.items():
-                if v.default is not inspect.Parameter.empty:
-                    _kwargs[k] = v.default
-                else:
-                    _kwargs[k] = None
-
-            # Merge the default keyword arguments with the provided kwargs
-            for k in kwargs.keys():
-                _kwargs[k] = kwargs[k]
-
-            # Replace args
-            _args = list(_kwargs.values())
-            _args = list(args) + _args[n_args:]
-
+            # Fill missing arguments with keyword arguments or default values
+            _args = list(args) + [kwargs.get(k, v) for k, v in defaults[len(args) :]]
             return _forward_fn(*_args)
 
         # Bind the new signature to the function
         forward_fn.__signature__ = forward_sig
 
-        forward_fn = autocast(forward_fn)
-        if compile:
-            return torch.compile(forward_fn)
-        return forward_fn
+        return autocast(forward_fn)
 
-    def jacobian(self, compile: bool = False) -> Callable:
+    def jacobian(self, compile: bool | str = False) -> Callable:
         """
         Get Jacobian method.
 
         Parameters
         ----------
-        compile : bool, optional
+        compile : bool | str, optional
             Compile function using ``torch.compile``. The default is ``False``.
+            If a string, it is used as compilation ``mode`` (e.g.,
+            ``"reduce-overhead"`` to replay the pulse train as a CUDA graph).
+            Compiled kernels are cached on disk by TorchInductor, hence the
+            compilation cost is paid once across processes; set
+            ``TORCHINDUCTOR_CACHE_DIR`` to persist the cache (e.g., on CI).
 
         Returns
         -------
@@ -348,92 +348,98 @@ class AbstractModel(ABC):
             k: v for k, v in kwargs.items() if k not in self.broadcastable_params
         }
 
-        _jacobian_fn = self._jacobian(**non_broadcastable_kwargs)
-
-        # Update the signature of the forward_fn
-        # Extract the signature of `_engine`
-        engine_sig = inspect.signature(self._engine)
-        jacobian_sig = inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    name=param_name,
-                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    default=engine_sig.parameters[param_name].default,
-                )
-                for param_name in self.broadcastable_params
-            ]
+        _jacobian_fn = self._jacobian(compile=compile, **non_broadcastable_kwargs)
+
+        # Get broadcastable signature of `_engine` and its default values
+        jacobian_sig, defaults = _get_signature(
+            self._engine, tuple(self.broadcastable_params)
         )
 
         def jacobian_fn(*args, **kwargs):
-            # Get number of arguments
-            n_args = len(args)
-
-            # Create a dictionary of keyword arguments and their default values
-            _kwargs = {}
-            for k, v in jacobian_sig.parameters.items():
-                if v.default is not inspect.Parameter.empty:
-                    _kwargs[k] = v.default
-                else:
-                    _kwargs[k] = None
-
-            # Merge the default keyword arguments with the provided kwargs
-            for k in kwargs.keys():
-                _kwargs[k] = kwargs[k]
-
-            # Replace args
-            _args = list(_kwargs.values())
-            _args = list(args) + _args[n_args:]
-
+            # Fill missing arguments with keyword arguments or default values
+            _args = list(args) + [kwargs.get(k, v) for k, v in defaults[len(args) :]]
             return _jacobian_fn(*_args)
 
         # Bind the new signature to the function
         jacobian_fn.__signature__ = jacobian_sig
 
-        jacobian_fn = autocast(jacobian_fn)
-        if compile:
-            return torch.compile(jacobian_fn)
-        return jacobian_fn
+        return autocast(jacobian_fn)
 
 
 # %% TODO: move
-def _is_implemented(method) -> bool:
-    """Check if the method is implemented or raises NotImplementedError."""
-    try:
-        # Check if the method raises NotImplementedError or has no implementation
-        source_code = inspect.getsource(method)
-        return (
-            "raise NotImplementedError" not in source_code and "pass" not in source_code
-        )
-    except AttributeError:
-        return False
-
-
-def _get_args(func, args, kwargs):
-    """Convert input args/kwargs mix to a list of positional arguments.
-
-    This automatically fills missing kwargs with default values.
-    """
+@functools.cache
+def _get_defaults(func):
+    """Get parameter names and default values (None if missing) of func."""
     signature = inspect.signature(func)
 
-    # Get number of arguments
-    n_args = len(args)
-
-    # Create a dictionary of keyword arguments and their default values
-    _kwargs = {}
+    # Extract default values for all parameters
+    default_args = {}
     for k, v in signature.parameters.items():
         if v.default is not inspect.Parameter.empty:
-            _kwargs[k] = v.default
+            default_args[k] = v.default
         else:
-            _kwargs[k] = None
+            default_args[k] = None
+
+    return tuple(signature.parameters.keys()), default_args
+
+
+@functools.cache
+def _get_signature(engine, broadcastable_params):
+    """Build signature and default values of broadcastable engine arguments."""
+    engine_sig = inspect.signature(engine)
+    signature = inspect.Signature(
+        parameters=[
+            inspect.Parameter(
+                name=param_name,
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=engine_sig.parameters[param_name].default,
+            )
+            for param_name in broadcastable_params
+        ]
+    )
+
+    # Missing arguments without a default value are filled with None
+    defaults = []
+    for k, v in signature.parameters.items():
+        if v.default is not inspect.Parameter.empty:
+            defaults.append((k, v.default))
+        else:
+            defaults.append((k, None))
+
+    return signature, tuple(defaults)
+
+
+def _vmap(func, chunk_size=None):
+    """Vectorize func over leading axis of batched inputs, sharing 0-d ones."""
+
+    # vmapped engines, one per batched/shared inputs pattern
+    engines = {}
+
+    def vmapped(*args):
+        in_dims = tuple(
+            0 if isinstance(arg, torch.Tensor) and arg.ndim != 0 else None
+            for arg in args
+        )
+        if in_dims not in engines:
+            engines[in_dims] = torch.vmap(func, in_dims=in_dims, chunk_size=chunk_size)
+        return engines[in_dims](*args)
+
+    return vmapped
+
 
-    # Merge the default keyword arguments with the provided kwargs
-    for k in kwargs.keys():
-        _kwargs[k] = kwargs[k]
+def _compile(func, compile):
+    """Compile ``func`` for fixed shapes; a string ``compile`` selects the mode."""
+    if not compile:
+        return func
+    mode = compile if isinstance(compile, str) else None
+    return torch.compile(func, dynamic=False, mode=mode)
 
-    # Replace args
-    _args = list(_kwargs.values())
 
-    return list(args) + _args[n_args:]
+def _to_device(arg, device):
+    """Move tensors to the target device, leaving other objects untouched."""
+    if isinstance(arg, torch.Tensor):
+        return arg.to(device)
+    return arg
 
 
 def _get_argnums(diff, ARGS):  # noqa
@@ -55,10 +55,6 @@ def _prepare_R2_prime(T2, T2_star):
     if torch.any(T2_star >= T2):
         raise ValueError("T2* must be less than T2.")
 
-    # Calculate R2 (1/s)
-    R2 = 1.0 / (T2 + EPSILON)
-
-    # Calculate R2' = R2* - R2 = (1/T2*) - R2 (1/s)
-    R2_prime = 1.0 / (T2_star + EPSILON) - R2
-
-    return R2_prime
+    # Calculate R2' = R2* - R2 = (1/T2*) - (1/T2) (1/s) over a common
+    # denominator, regularized only there
+    return (T2 - T2_star) / ((T2_star + EPSILON) * (T2 + EPSILON))
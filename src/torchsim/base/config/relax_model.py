@@ -28,14 +28,13 @@ def _particle_conservation(k: torch.Tensor) -> torch.Tensor:
     """
     # Get the number of pools (assumed to be the last dimension of the tensor)
     npools = k.shape[-1]
+    eye = torch.eye(npools, dtype=k.dtype, device=k.device)
 
-    for n in range(npools):
-        # Set the diagonal to zero
-        k[..., n, n] = 0.0
-        # Adjust diagonal to ensure conservation: sum of outgoing = sum of incoming
-        k[..., n, n] = -k[..., n].sum(dim=-1)
+    # Set the diagonal to zero
+    k = k * (1 - eye)
 
-    return k
+    # Adjust diagonal to ensure conservation: sum of outgoing = sum of incoming
+    return k - eye * k.sum(dim=-2, keepdim=True)
 
 
 def build_two_pool_exchange_matrix(
@@ -17,9 +17,12 @@ def autocast(func: Callable) -> Callable:
     Force all inputs to be torch tensors of the same size on the same device.
     """
 
+    # inspect signature once, at decoration time
+    defaults = _get_default_kwargs(func)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        args, kwargs = _fill_kwargs(func, args, kwargs)
+        args, kwargs = _fill_kwargs(defaults, args, kwargs)
 
         # convert arrays to torch
         args, kwargs = _to_torch(*args, **kwargs)
@@ -46,13 +49,25 @@ def autocast(func: Callable) -> Callable:
 
 
 # %% subroutines
-def _fill_kwargs(func, args, kwargs):
+def _fill_kwargs(defaults, args, kwargs):
     """This automatically fills missing kwargs with default values."""
-    signature = inspect.signature(func)
-
     # Get number of arguments
     n_args = len(args)
 
+    # Merge the default keyword arguments with the provided kwargs
+    _kwargs = {**defaults, **kwargs}
+
+    # Replace args
+    _keys = list(_kwargs.keys())[n_args:]
+    _values = list(_kwargs.values())[n_args:]
+
+    return args, dict(zip(_keys, _values))
+
+
+def _get_default_kwargs(func):
+    """Get default values of ``func`` arguments (``None`` if missing)."""
+    signature = inspect.signature(func)
+
     # Create a dictionary of keyword arguments and their default values
     _kwargs = {}
     for k, v in signature.parameters.items():
@@ -61,15 +76,7 @@ def _fill_kwargs(func, args, kwargs):
         else:
             _kwargs[k] = None
 
-    # Merge the default keyword arguments with the provided kwargs
-    for k in kwargs.keys():
-        _kwargs[k] = kwargs[k]
-
-    # Replace args
-    _keys = list(_kwargs.keys())[n_args:]
-    _values = list(_kwargs.values())[n_args:]
-
-    return args, dict(zip(_keys, _values))
+    return _kwargs
 
 
 def _enforce_precision(*args, **kwargs):
@@ -81,7 +88,7 @@ def _enforce_precision(*args, **kwargs):
 
     # convert keyworded
     if kwargs:
-        process_kwargs_vals, _ = _to_tensors(*kwargs.values())
+        process_kwargs_vals, _ = _enforce_precision(*kwargs.values())
         kwargs = {k: v for k, v in zip(kwargs.keys(), process_kwargs_vals)}
 
     return args, kwargs
@@ -106,11 +113,10 @@ def _to_tensors(*args, **kwargs):
 
 def _to_device(device, *args, **kwargs):
     """Enforce same device."""
-    for arg in args:
-        try:
-            arg = arg.to(device)
-        except Exception:
-            pass
+    args = list(args)
+    for n in range(len(args)):
+        if isinstance(args[n], torch.Tensor):
+            args[n] = args[n].to(device)
 
     # convert keyworded
     if kwargs:
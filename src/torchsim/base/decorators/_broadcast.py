@@ -15,15 +15,13 @@ def broadcast(func: Callable) -> Callable:
 
     @wraps(func)
     def wrapper(*args):
-        shape = _find_first_nonscalar_shape(args)
-
-        # broadcast
+        # broadcast (views, no copies) and get the common batch shape
         args, _ = broadcast_arguments(*args)
+        shape = _find_first_nonscalar_shape(args)
 
-        # run function
+        # run function (output dtype is decided by the engine itself: checking
+        # whether a complex output is numerically real would force a sync)
         output = func(*args)
-        if torch.isreal(output).all():
-            output = output.real
         return output.reshape(*shape, *output.shape[1:]).squeeze()
 
     return wrapper
@@ -31,25 +29,38 @@ def broadcast(func: Callable) -> Callable:
 
 def broadcast_arguments(*args, **kwargs) -> tuple[list, dict]:
     """
-    Force all inputs to be torch tensors of the same size.
+    Force all non-scalar inputs to be torch tensors of the same size.
+
+    Scalar (0-d) tensors are left untouched, so that they can be shared
+    across atoms instead of being expanded to the batch size.
     """
     # enforge mutable
     args = list(args)
 
-    items, kwitems, indexes, keys = _get_tensor_args_kwargs(*args, **kwargs)
-    items = [torch.atleast_1d(item) for item in items]
-    kwitems = {k: torch.atleast_1d(v) for k, v in kwitems.items()}
-    tmp = torch.broadcast_tensors(*items, *list(kwitems.values()))
-    tmp = list(tmp)
-    for n in range(len(items)):
-        items[n] = tmp[0]
-        tmp.pop(0)
-    kwitems = dict(zip(kwitems.keys(), tmp))
-
-    for idx in indexes:
-        args[idx] = items[idx]
-    for key in kwitems.keys():
-        kwargs[key] = kwitems[key]
+    # collect varying and scalar tensors in a single pass
+    batched, scalars = {}, {}
+    for key, value in [*enumerate(args), *kwargs.items()]:
+        if isinstance(value, torch.Tensor):
+            if value.ndim != 0:
+                batched[key] = value
+            else:
+                scalars[key] = value
+
+    # keep scalars as 0-d tensors (shared across atoms) unless all are scalars
+    if not batched:
+        batched = {key: value[None] for key, value in scalars.items()}
+
+    # broadcast varying tensors to a common shape (expanded views, no copies),
+    # unless they already share the same shape
+    if len({value.shape for value in batched.values()}) > 1:
+        tmp = torch.broadcast_tensors(*batched.values())
+    else:
+        tmp = batched.values()
+    for key, value in zip(batched.keys(), tmp):
+        if isinstance(key, int):
+            args[key] = value
+        else:
+            kwargs[key] = value
 
     return args, kwargs
 
@@ -62,20 +73,3 @@ def _find_first_nonscalar_shape(batched_args):  # noqa
         if arg.ndim != 0:
             return arg.shape
     return shape
-
-
-def _get_tensor_args_kwargs(*args, **kwargs):
-    items = []
-    kwitems = {}
-    indexes = []
-    keys = []
-    for n in range(len(args)):
-        if isinstance(args[n], torch.Tensor):
-            items.append(args[n])
-            indexes.append(n)
-    for key in kwargs.keys():
-        if isinstance(kwargs[key], torch.Tensor):
-            kwitems[key] = kwargs[key]
-            keys.append(key)
-
-    return items, kwitems, indexes, keys
@@ -2,7 +2,7 @@
 
 __all__ = ["jacfwd"]
 
-from functools import wraps
+from functools import partial, wraps
 
 from typing import Callable, Optional
 import torch
@@ -24,6 +24,21 @@ def jacfwd(argnums: tuple[int]) -> Callable:
     """
 
     def decorator(fn: Callable) -> Callable:
+        # Output dtype is static: record it while tracing, so that real outputs
+        # skip the real-imag split (no sync, no zero imaginary tangents)
+        is_complex = [True]
+
+        # Define a wrapper function to evaluate real-imag split output
+        def wrapped_fn(*wrapped_args, **kwargs):
+            output = fn(*wrapped_args, **kwargs)
+            is_complex[0] = torch.is_complex(output)
+            if is_complex[0]:
+                return _split_real_imag(output)
+            return output
+
+        # Build the transformed function once, at decoration time
+        jacfwd_fn = torch.func.jacfwd(wrapped_fn, argnums=argnums)
+
         @wraps(fn)
         def wrapper(*args, **kwargs) -> tuple[torch.Tensor, Optional[torch.Tensor]]:
             """
@@ -34,15 +49,16 @@ def jacfwd(argnums: tuple[int]) -> Callable:
             Tuple[torch.Tensor, Optional[torch.Tensor]]
                 Original function output and its Jacobian.
             """
+            # Compute the Jacobian using jacfwd (keyworded arguments are bound
+            # to a new function, as they are not differentiated)
+            if kwargs:
+                jacobian = torch.func.jacfwd(
+                    partial(wrapped_fn, **kwargs), argnums=argnums
+                )(*args)
+            else:
+                jacobian = jacfwd_fn(*args)
 
-            # Define a wrapper function to evaluate real-imag split output
-            def wrapped_fn(*wrapped_args):
-                return _split_real_imag(fn(*wrapped_args, **kwargs))
-
-            # Compute the Jacobian using jacfwd
-            jacobian = torch.func.jacfwd(wrapped_fn, argnums=argnums)(*args)
-
-            return _combine_real_imag(jacobian)
+            return _combine_real_imag(jacobian, is_complex[0])
 
         return wrapper
 
@@ -51,18 +67,15 @@ def jacfwd(argnums: tuple[int]) -> Callable:
 
 # %% subroutines
 def _split_real_imag(tensor: torch.Tensor) -> torch.Tensor:
-    """Split complex tensor into real and imaginary components."""
-    if torch.is_complex(tensor):
-        return torch.stack([tensor.real, tensor.imag], dim=0)
-    else:
-        return torch.stack([tensor, torch.zeros_like(tensor)], dim=0)
+    """Split complex tensor into real and imaginary components along last axis."""
+    return torch.view_as_real(tensor)
 
 
-def _combine_real_imag(split_tensor: torch.Tensor) -> torch.Tensor:
+def _combine_real_imag(split_tensor: torch.Tensor, is_complex: bool = True):
     """Combine split real and imaginary components into a complex tensor."""
     if isinstance(split_tensor, tuple):
-        output = [tensor[..., 0, :] + 1j * tensor[..., 1, :] for tensor in split_tensor]
-        output = torch.stack(output, dim=0)
-    else:
-        output = split_tensor[..., 0, :] + 1j * split_tensor[..., 1, :]
-    return output
+        # stacking yields a contiguous tensor: view it as complex in one go
+        split_tensor = torch.stack(split_tensor, dim=0)
+    if not is_complex:
+        return split_tensor
+    return torch.view_as_complex(split_tensor.contiguous())
@@ -38,6 +38,12 @@ from ._transverse_relaxation import *  # noqa
 __all__.extend(_transverse_relaxation.__all__)
 
 
+from . import _evolve
+from ._evolve import *  # noqa
+
+__all__.extend(_evolve.__all__)
+
+
 from . import _diffusion
 from ._diffusion import *  # noqa
 
@@ -27,5 +27,5 @@ def adiabatic_inversion(
         Output EPG states.
 
     """
-    states.Z = -inv_efficiency * states.Z.clone()
+    states.Z = -inv_efficiency * states.Z
     return states
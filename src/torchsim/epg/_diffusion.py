@@ -87,9 +87,9 @@ def diffusion(
     Z = states.Z
 
     # apply
-    Fplus = Fplus.clone() * D2  # Transverse damping
+    Fplus = Fplus * D2  # Transverse damping
     Fminus = Fminus * D2  # Transverse damping
-    Z = Z.clone() * D1  # Longitudinal damping
+    Z = Z * D1  # Longitudinal damping
 
     # prepare for output
     states.Fplus = Fplus
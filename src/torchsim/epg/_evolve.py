@@ -0,0 +1,55 @@
+"""Free precession operator."""
+
+__all__ = ["evolve"]
+
+from types import SimpleNamespace
+
+import torch
+
+from ._longitudinal_relaxation import longitudinal_relaxation
+from ._shift import shift
+from ._transverse_relaxation import transverse_relaxation
+
+
+def evolve(
+    states: SimpleNamespace,
+    E1: torch.Tensor,
+    rE1: torch.Tensor,
+    E2: torch.Tensor,
+    delta: int = 1,
+) -> SimpleNamespace:
+    """
+    Apply relaxation, recovery and gradient dephasing.
+
+    This is a shorthand for ``longitudinal_relaxation``, ``transverse_relaxation``
+    and ``shift``, applied in this order.
+
+    Parameters
+    ----------
+    states : SimpleNamespace
+        Input EPG states.
+    E1 : torch.Tensor
+        Longitudinal relaxation operator.
+    rE1 : torch.Tensor
+        Longitudinal recovery operator.
+    E2 : torch.Tensor
+        Transverse relaxation operator.
+    delta : int, optional
+        Integer states shift. The default is 1.
+
+    Returns
+    -------
+    SimpleNamespace
+        Output EPG states.
+
+    Notes
+    -----
+    Using this operator where the shift should come first (e.g., right after
+    refocusing in FSE) is only valid if ``E2`` is real and the same for all the
+    dephasing states (i.e., no off-resonance or diffusion weighting), since
+    only then transverse relaxation commutes with the shift.
+
+    """
+    states = longitudinal_relaxation(states, E1, rE1)
+    states = transverse_relaxation(states, E2)
+    return shift(states, delta)
@@ -80,9 +80,9 @@ def flow(
     Z = states.Z
 
     # apply
-    Fplus = Fplus.clone() * J2  # Transverse dephasing
-    Fminus = Fminus.clone() * J2.conj()  # Transverse dephasing
-    Z = Z.clone() * J1  # Longitudinal dephasing
+    Fplus = Fplus * J2  # Transverse dephasing
+    Fminus = Fminus * J2.conj()  # Transverse dephasing
+    Z = Z * J1  # Longitudinal dephasing
 
     # prepare for output
     states.Fplus = Fplus
@@ -176,9 +176,9 @@ def washout(
     Zmoving = moving_states.Z
 
     # apply
-    Fplus = Wout * Fplus.clone() + Win * FplusMoving
-    Fminus = Wout * Fminus.clone() + Win * FminusMoving
-    Z = Wout * Z.clone() + Win * Zmoving
+    Fplus = Wout * Fplus + Win * FplusMoving
+    Fminus = Wout * Fminus + Win * FminusMoving
+    Z = Wout * Z + Win * Zmoving
 
     # prepare for output
     states.Fplus = Fplus
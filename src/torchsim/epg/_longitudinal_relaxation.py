@@ -109,12 +109,9 @@ def longitudinal_relaxation(
         Output EPG states.
 
     """
-    # parse
-    Z = states.Z.clone()
-
-    # apply
-    Z = Z.clone() * E1  # decay
-    Z[0] = Z[0].clone() + rE1  # regrowth
+    # apply (decay yields a new tensor: regrowth can be added in-place)
+    Z = states.Z * E1  # decay
+    Z[0] += rE1  # regrowth
 
     # prepare for output
     states.Z = Z
@@ -144,12 +141,9 @@ def longitudinal_relaxation_exchange(
         Output EPG states.
 
     """
-    # parse
-    Z = states.Z.clone()
-
-    # apply
-    Z = torch.einsum("...ij,...j->...i", E1, Z.clone())
-    Z[0] = Z[0].clone() + rE1
+    # apply (einsum yields a new tensor: regrowth can be added in-place)
+    Z = torch.einsum("...ij,...j->...i", E1, states.Z)
+    Z[0] += rE1
 
     # prepare for output
     states.Z = Z
@@ -28,7 +28,7 @@ def rf_pulse_op(
     fa: float,
     slice_prof: float | torch.Tensor = 1.0,
     B1: float = 1.0,
-) -> tuple[tuple[torch.Tensor]]:
+) -> torch.Tensor:
     """
     Build RF rotation matrix.
 
@@ -43,15 +43,12 @@ def rf_pulse_op(
 
     Returns
     -------
-    T : tuple[tuple[torch.Tensor]]
-        RF rotation matrix elements.
+    T : torch.Tensor
+        RF rotation matrix of shape ``(3, 3, ..., 1)``.
 
     """
-    # apply B1 effect
-    fa = B1 * fa
-
-    # apply slice profile
-    fa = slice_prof * fa
+    # apply B1 effect and slice profile (scale factors first: one full-size product)
+    fa = (B1 * _as_tensor(slice_prof)) * _as_tensor(fa)
 
     return _prep_rf(fa)
 
@@ -62,7 +59,7 @@ def phased_rf_pulse_op(
     slice_prof: float | torch.Tensor = 1.0,
     B1: float = 1.0,
     B1phase: float = 0.0,
-) -> tuple[tuple[torch.Tensor]]:
+) -> torch.Tensor:
     """
     Build RF rotation matrix along arbitrary axis.
 
@@ -81,17 +78,14 @@ def phased_rf_pulse_op(
 
     Returns
     -------
-    T : tuple[tuple[torch.Tensor]]
-        RF rotation matrix elements.
+    T : torch.Tensor
+        RF rotation matrix of shape ``(3, 3, ..., 1)``.
 
     """
-    # apply B1 effect
-    fa = B1 * fa
+    # apply B1 effect and slice profile (scale factors first: one full-size product)
+    fa = (B1 * _as_tensor(slice_prof)) * _as_tensor(fa)
     phi = B1phase + phi
 
-    # apply slice profile
-    fa = slice_prof * fa
-
     return _prep_phased_rf(fa, phi)
 
 
@@ -99,7 +93,7 @@ def multidrive_rf_pulse_op(
     fa: torch.Tensor,
     slice_prof: float | torch.Tensor = 1.0,
     B1: float = 1.0,
-) -> tuple[tuple[torch.Tensor]]:
+) -> torch.Tensor:
     """
     Build RF rotation matrix for a multichannel RF pulse.
 
@@ -117,8 +111,8 @@ def multidrive_rf_pulse_op(
 
     Returns
     -------
-    T : tuple[tuple[torch.Tensor]]
-        RF rotation matrix elements.
+    T : torch.Tensor
+        RF rotation matrix of shape ``(3, 3, ..., 1)``.
 
     """
     # apply B1 effect
@@ -136,7 +130,7 @@ def phased_multidrive_rf_pulse_op(
     slice_prof: float | torch.Tensor = 1.0,
     B1: torch.Tensor = 1.0,
     B1phase: torch.Tensor = 0.0,
-) -> tuple[tuple[tuple[torch.Tensor]], torch.Tensor]:
+) -> tuple[torch.Tensor, torch.Tensor]:
     """
     Build RF rotation matrix for a multichannel RF pulse along arbitrary axis.
 
@@ -161,8 +155,8 @@ def phased_multidrive_rf_pulse_op(
 
     Returns
     -------
-    T : tuple[tuple[torch.Tensor]]
-        RF rotation matrix elements.
+    T : torch.Tensor
+        RF rotation matrix of shape ``(3, 3, ..., 1)``.
     phi : torch.Tensor
         Nominal net RF phase for signal demodulation.
 
@@ -277,10 +271,15 @@ def initialize_mt_sat(
             ...
 
     """
-    # get parameters
-    tau = duration * 1e3  # [ms]
-    b1rms = b1rms * 1e6  # [uT]
+    # get parameters (in single precision, otherwise double precision inputs
+    # promote saturation operator and bound pool states)
+    b1rms = torch.as_tensor(b1rms, dtype=torch.float32) * 1e6  # [uT]
+    tau = torch.as_tensor(duration, dtype=torch.float32, device=b1rms.device)
+    tau = tau * 1e3  # [ms]
+
+    # lineshape is evaluated in numpy (float64): cast as well
     G = super_lorentzian_lineshape(df)
+    G = torch.as_tensor(G, dtype=torch.float32, device=b1rms.device)
 
     # calculate WT
     W = torch.pi * (gamma * 1e-3) ** 2 * b1rms**2 * G
@@ -366,7 +365,7 @@ def multidrive_mt_sat_op(
 
 def rf_pulse(
     states: SimpleNamespace,
-    RF: tuple[tuple[torch.Tensor]],
+    RF: torch.Tensor,
 ) -> SimpleNamespace:
     """
     Apply RF rotation, mixing EPG states.
@@ -375,8 +374,9 @@ def rf_pulse(
     ----------
     states : SimpleNamespace
         Input EPG states.
-    RF : tuple[tuple[torch.Tensor]]
-        RF rotation matrix elements.
+    RF : torch.Tensor
+        RF rotation matrix of shape ``(3, 3, ...)``
+        (or nested sequence of its elements).
 
     Returns
     -------
@@ -388,15 +388,8 @@ def rf_pulse(
     FminusIn = states.Fminus
     ZIn = states.Z
 
-    # prepare out
-    FplusOut = FplusIn.clone()
-    FminusOut = FminusIn.clone()
-    ZOut = ZIn.clone()
-
     # apply
-    FplusOut = RF[0][0] * FplusIn + RF[0][1] * FminusIn + RF[0][2] * ZIn
-    FminusOut = RF[1][0] * FplusIn + RF[1][1] * FminusIn + RF[1][2] * ZIn
-    ZOut = RF[2][0] * FplusIn + RF[2][1] * FminusIn + RF[2][2] * ZIn
+    FplusOut, FminusOut, ZOut = _mix(RF, FplusIn, FminusIn, ZIn)
 
     # prepare for output
     states.Fplus = FplusOut
@@ -408,7 +401,7 @@ def rf_pulse(
 
 def rf_pulse_mt(
     states: SimpleNamespace,
-    RF: tuple[tuple[torch.Tensor]],
+    RF: torch.Tensor,
 ) -> SimpleNamespace:
     """
     Apply RF rotation in presence of a bound pool, mixing free EPG states.
@@ -417,8 +410,9 @@ def rf_pulse_mt(
     ----------
     states : SimpleNamespace
         Input EPG states.
-    RF : tuple[tuple[torch.Tensor]]
-        RF rotation matrix elements.
+    RF : torch.Tensor
+        RF rotation matrix of shape ``(3, 3, ...)``
+        (or nested sequence of its elements).
 
     Returns
     -------
@@ -430,15 +424,8 @@ def rf_pulse_mt(
     FminusIn = states.Fminus
     ZIn = states.Z[..., :-1]
 
-    # prepare out
-    FplusOut = FplusIn.clone()
-    FminusOut = FminusIn.clone()
-    ZOut = ZIn.clone()
-
     # apply
-    FplusOut = RF[0][0] * FplusIn + RF[0][1] * FminusIn + RF[0][2] * ZIn
-    FminusOut = RF[1][0] * FplusIn + RF[1][1] * FminusIn + RF[1][2] * ZIn
-    ZOut = RF[2][0] * FplusIn + RF[2][1] * FminusIn + RF[2][2] * ZIn
+    FplusOut, FminusOut, ZOut = _mix(RF, FplusIn, FminusIn, ZIn)
 
     # prepare for output
     states.Fplus = FplusOut
@@ -473,7 +460,7 @@ def mt_sat(
     ]  # assume we have a single bound pool at last position in pool axis
 
     # prepare
-    Zbound = S * Zbound.clone()
+    Zbound = S * Zbound
 
     # prepare for output
     states.Z = Zbound
@@ -482,50 +469,82 @@ def mt_sat(
 
 
 # %% utils
-def _prep_rf(fa):
-    # calculate operator
-    T00 = torch.cos(fa / 2) ** 2
-    T01 = torch.sin(fa / 2) ** 2
-    T02 = -1j * torch.sin(fa)
-    T10 = T01.conj()
-    T11 = T00
-    T12 = 1j * torch.sin(fa)
-    T20 = -0.5 * 1j * torch.sin(fa)
-    T21 = 0.5 * 1j * torch.sin(fa)
-    T22 = torch.cos(fa)
+def _mix(RF, FplusIn, FminusIn, ZIn):
+    # elementwise products (works for stacked and nested operators alike); a
+    # single einsum would require states, RF and their tangents to share dtype
+    FplusOut = RF[0][0] * FplusIn + RF[0][1] * FminusIn + RF[0][2] * ZIn
+    FminusOut = RF[1][0] * FplusIn + RF[1][1] * FminusIn + RF[1][2] * ZIn
+    ZOut = RF[2][0] * FplusIn + RF[2][1] * FminusIn + RF[2][2] * ZIn
+
+    return FplusOut, FminusOut, ZOut
+
 
-    # build rows
-    T0 = [T00[..., None], T01[..., None], T02[..., None]]
-    T1 = [T10[..., None], T11[..., None], T12[..., None]]
-    T2 = [T20[..., None], T21[..., None], T22[..., None]]
+def _as_tensor(x):
+    # Python floats promote forward-mode tangents of 0-d inputs (e.g., B1)
+    # to double precision: use single precision tensors, as autocast does
+    if isinstance(x, torch.Tensor):
+        return x
+    return torch.as_tensor(x, dtype=torch.float32)
+
+
+def _prep_rf(fa):
+    # calculate shared trigonometric terms once (half-angle identities)
+    ca, sa = torch.cos(fa), torch.sin(fa)
+    half = _as_tensor(0.5)
+    c2, s2 = half * (1 + ca), half * (1 - ca)  # cos(fa / 2)**2, sin(fa / 2)**2
+    hsa = half * sa
+    zero = torch.zeros_like(ca)
 
-    # build matrix
-    T = [T0, T1, T2]
+    # build matrix from real and imaginary parts (no promotion by complex scalars)
+    re = torch.stack([c2, s2, zero, s2, c2, zero, zero, zero, ca])
+    im = torch.stack([zero, zero, -sa, zero, zero, sa, -hsa, hsa, zero])
+    T = torch.complex(re, im)
 
-    return T
+    return T.reshape(3, 3, *fa.shape, 1)
 
 
 def _prep_phased_rf(fa, phi):
-    # calculate operator
-    T00 = torch.cos(fa / 2) ** 2
-    T01 = torch.exp(2 * 1j * phi) * (torch.sin(fa / 2)) ** 2
-    T02 = -1j * torch.exp(1j * phi) * torch.sin(fa)
-    T10 = T01.conj()
-    T11 = T00
-    T12 = 1j * torch.exp(-1j * phi) * torch.sin(fa)
-    T20 = -0.5 * 1j * torch.exp(-1j * phi) * torch.sin(fa)
-    T21 = 0.5 * 1j * torch.exp(1j * phi) * torch.sin(fa)
-    T22 = torch.cos(fa)
-
-    # build rows
-    T0 = [T00[..., None], T01[..., None], T02[..., None]]
-    T1 = [T10[..., None], T11[..., None], T12[..., None]]
-    T2 = [T20[..., None], T21[..., None], T22[..., None]]
-
-    # build matrix
-    T = [T0, T1, T2]
-
-    return T
+    fa, phi = torch.broadcast_tensors(fa, torch.as_tensor(phi, device=fa.device))
+
+    # calculate shared trigonometric terms once (half-angle identities)
+    ca, sa = torch.cos(fa), torch.sin(fa)
+    half = _as_tensor(0.5)
+    c2, s2 = half * (1 + ca), half * (1 - ca)  # cos(fa / 2)**2, sin(fa / 2)**2
+    hsa = half * sa
+    cp, sp = torch.cos(phi), torch.sin(phi)
+    c2p, s2p = torch.cos(phi + phi), torch.sin(phi + phi)
+    zero = torch.zeros_like(ca)
+
+    # build matrix from real and imaginary parts (no promotion by complex scalars)
+    re = torch.stack(
+        [
+            c2,
+            s2 * c2p,
+            sa * sp,
+            s2 * c2p,
+            c2,
+            sa * sp,
+            -hsa * sp,
+            -hsa * sp,
+            ca,
+        ],
+    )
+    im = torch.stack(
+        [
+            zero,
+            s2 * s2p,
+            -sa * cp,
+            -s2 * s2p,
+            zero,
+            sa * cp,
+            -hsa * cp,
+            hsa * cp,
+            zero,
+        ],
+    )
+    T = torch.complex(re, im)
+
+    return T.reshape(3, 3, *fa.shape, 1)
 
 
 def super_lorentzian_lineshape(
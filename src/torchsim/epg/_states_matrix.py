@@ -45,12 +45,11 @@ def states_matrix(
             * Z: longitudinal Z states of shape (nstates, nlocs, nlong_pools)
 
     """
-    Fplus = torch.zeros(
-        (nstates, nlocs, ntrans_pools), dtype=torch.complex64, device=device
-    )
-    Fminus = torch.zeros(
-        (nstates, nlocs, ntrans_pools), dtype=torch.complex64, device=device
+    # F+ and F- share the same shape: allocate them as one contiguous block
+    F = torch.zeros(
+        (2, nstates, nlocs, ntrans_pools), dtype=torch.complex64, device=device
     )
+    Fplus, Fminus = F[0], F[1]
     Z = torch.zeros((nstates, nlocs, nlong_pools), dtype=torch.complex64, device=device)
     Z[0] = 1.0
     Z = Z * weight
@@ -100,8 +100,8 @@ def transverse_relaxation(
     Fminus = states.Fminus
 
     # apply
-    Fplus = Fplus.clone() * E2  # F+
-    Fminus = Fminus.clone() * E2  # F-
+    Fplus = Fplus * E2  # F+
+    Fminus = Fminus * E2  # F-
 
     # prepare for output
     states.Fplus = Fplus
@@ -133,8 +133,8 @@ def transverse_relaxation_exchange(
     Fminus = states.Fminus
 
     # apply
-    Fplus = torch.einsum("...ij,...j->...i", E2, Fplus.clone())
-    Fminus = torch.einsum("...ij,...j->...i", E2.conj(), Fminus.clone())
+    Fplus = torch.einsum("...ij,...j->...i", E2, Fplus)
+    Fminus = torch.einsum("...ij,...j->...i", E2.conj(), Fminus)
 
     # prepare for output
     states.Fplus = Fplus
@@ -3,15 +3,11 @@ Utilities related to MR simulation.
 """
 
 import torch
-from torch.func import vmap
 
 # 1H Gyromagnetic Factor
 gamma_bar = 42.577  # MHz / T
 gamma = 2 * torch.pi * gamma_bar
 
-# define helper
-bdiag = vmap(torch.diag)
-
 
 def matrix_exp(input: torch.Tensor):
     """
@@ -99,9 +99,9 @@ class bSSFPModel(AbstractModel):
             The default is ``None`` (i.e., ``TR/2``).
 
         """
-        self.sequence.flip = torch.pi * flip / 180.0
+        self.sequence.flip = flip * (torch.pi / 180.0)
         self.sequence.TR = TR * 1e-3  # ms -> s
-        self.sequence.phase_inc = torch.pi * phase_inc / 180.0
+        self.sequence.phase_inc = phase_inc * (torch.pi / 180.0)
         if TE is None:
             TE = TR / 2
         self.sequence.TE = TE * 1e-3  # ms -> s
@@ -119,7 +119,8 @@ class bSSFPModel(AbstractModel):
         phase_inc: float = 180.0,
     ):
         # Prepare relaxation parameters
-        R1, R2 = 1e3 / T1, 1e3 / T2
+        scale = torch.as_tensor(1e3, device=T1.device)
+        R1, R2 = scale / T1, scale / T2
 
         # We are assuming Freeman-Hill convention for off-resonance map,
         # so we need to negate to make use with this Ernst-Anderson-based implementation from Hoff
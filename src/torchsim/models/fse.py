@@ -116,16 +116,17 @@ class FSEModel(AbstractModel):
             The default is ``10``.
 
         """
-        self.sequence.flip = torch.pi * flip / 180.0
+        self.sequence.flip = flip * (torch.pi / 180.0)
         self.sequence.ESP = ESP * 1e-3  # ms -> s
+        phases = phases * (torch.pi / 180.0)
         if phases.numel() == 1:
-            phases = phases * torch.ones_like(flip)
-        self.sequence.phases = torch.pi * phases / 180.0
-        self.sequence.exc_flip = torch.pi * exc_flip / 180.0
-        self.sequence.exc_phase = torch.pi * exc_phase / 180.0
+            phases = phases.reshape(()).expand(flip.shape)
+        self.sequence.phases = phases
+        self.sequence.exc_flip = exc_flip * (torch.pi / 180.0)
+        self.sequence.exc_phase = exc_phase * (torch.pi / 180.0)
         self.sequence.TR = TR * 1e-3  # ms -> s
         self.sequence.slice_prof = slice_prof
-        self.sequence.nstates = nstates
+        self.sequence.nstates = int(nstates)  # loop/shape size: keep on host
 
     @staticmethod
     def _engine(
@@ -143,7 +144,9 @@ class FSEModel(AbstractModel):
         nstates: int = 10,
     ):
         # Prepare relaxation parameters
-        R1, R2 = 1e3 / T1, 1e3 / T2
+        # (tensor constant: a Python float would promote tangents to double)
+        scale = torch.as_tensor(1e3, device=T1.device)
+        R1, R2 = scale / T1, scale / T2
 
         # Prepare EPG states matrix
         states = epg.states_matrix(
@@ -159,6 +162,9 @@ class FSEModel(AbstractModel):
         E1, rE1 = epg.longitudinal_relaxation_op(R1, 0.5 * ESP)
         E2 = epg.transverse_relaxation_op(R2, 0.5 * ESP)
 
+        # Prepare RF rotation operators for the whole refocusing train
+        RF = epg.phased_rf_pulse_op(flip[:, None], phases[:, None], slice_prof, B1)
+
         # Get number of shots
         etl = len(flip)
 
@@ -171,34 +177,31 @@ class FSEModel(AbstractModel):
         # Scan loop
         for p in range(etl):
             # Pre refocusing
-            states = epg.longitudinal_relaxation(states, E1, rE1)
-            states = epg.transverse_relaxation(states, E2)
-            states = epg.shift(states)
+            states = epg.evolve(states, E1, rE1, E2)
 
             # Refocus
-            RF = epg.phased_rf_pulse_op(flip[p], phases[p], slice_prof, B1)
-            states = epg.rf_pulse(states, RF)
+            states = epg.rf_pulse(states, RF[:, :, p])
 
             # Post refocusing
-            states = epg.shift(states)
-            states = epg.longitudinal_relaxation(states, E1, rE1)
-            states = epg.transverse_relaxation(states, E2)
+            states = epg.evolve(states, E1, rE1, E2)
 
             # Record signal
-            signal.append(epg.get_demodulated_signal(states, phases[p]))
+            signal.append(epg.get_signal(states))
 
-        # Get signal
-        signal = torch.stack(signal)  # (etl,)
-        signal = signal[..., None]  # (etl, 1)
+        # Get signal and demodulate RF phase for the whole echo train
+        signal = torch.stack(signal) * torch.exp(-1j * phases)  # (etl,)
 
         # Get elapsed time and time left before next TR
         elapsed_time = ESP * etl
         dt = TR - elapsed_time
 
-        # Calculate relaxation until TR
-        ETR = torch.exp(-R1 * dt)  # (nTR,)
+        # Calculate relaxation until TR: scalar for a single TR, (nTR, 1)
+        # otherwise, so that the signal is directly built in output layout
+        ETR = torch.exp(-R1 * dt)
+        if ETR.ndim != 0:
+            ETR = ETR[:, None]
 
         # Apply modulation
-        signal = M0 * signal * (1 - ETR) / (1 - ETR * signal)  # (etl, nTR)
+        signal = M0 * signal * (1 - ETR) / (1 - ETR * signal)  # (nTR, etl)
 
-        return signal.swapaxes(-1, -2).ravel()  # (nTR*etl,)
+        return signal.ravel()  # (nTR*etl,)
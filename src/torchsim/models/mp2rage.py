@@ -101,12 +101,12 @@ class MP2RAGEModel(AbstractModel):
         self.sequence.nshots = nshots
         self.sequence.TI = TI * 1e-3  # ms -> s
         if flip.numel() == 1:
-            flip = torch.repeat_interleave(flip, 2)
-        self.sequence.flip = torch.pi * flip / 180.0
+            flip = flip.reshape(()).expand(2)
+        self.sequence.flip = flip * (torch.pi / 180.0)
         self.sequence.TRspgr = TRspgr * 1e-3  # ms -> s
         self.sequence.TRmp2rage = TRmp2rage * 1e-3  # ms -> s
         if nshots.numel() == 1:
-            nshots = torch.repeat_interleave(nshots // 2, 2)
+            nshots = (nshots // 2).reshape(()).expand(2)
         self.sequence.nshots = nshots
 
     @staticmethod
@@ -120,7 +120,8 @@ class MP2RAGEModel(AbstractModel):
         M0: float | npt.ArrayLike = 1.0,
         inv_efficiency: float | npt.ArrayLike = 1.0,
     ):
-        R1 = 1e3 / T1
+        scale = torch.as_tensor(1e3, device=T1.device)
+        R1 = scale / T1
 
         # Calculate number of shots before and after DC sampling
         nshots_bef = nshots[0]
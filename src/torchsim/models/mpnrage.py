@@ -101,8 +101,8 @@ class MPnRAGEModel(AbstractModel):
             The default is ``1.0``.
 
         """
-        self.sequence.nshots = nshots
-        self.sequence.flip = torch.pi * flip / 180.0
+        self.sequence.nshots = int(nshots)  # loop/shape size: keep on host
+        self.sequence.flip = flip * (torch.pi / 180.0)
         self.sequence.TR = TR * 1e-3  # ms -> s
         self.sequence.TI = TI * 1e-3  # ms -> s
         self.sequence.slice_prof = slice_prof
@@ -120,16 +120,12 @@ class MPnRAGEModel(AbstractModel):
         slice_prof: float | npt.ArrayLike = 1.0,
     ):
         # Prepare relaxation parameters
-        R1 = 1e3 / T1
+        scale = torch.as_tensor(1e3, device=T1.device)
+        R1 = scale / T1
 
-        # Prepare EPG states matrix
-        states = epg.states_matrix(
-            device=R1.device,
-            nlocs=slice_prof.numel(),
-            nstates=1,
-        )
-        # Prepare excitation pulse
-        RF = epg.rf_pulse_op(flip, slice_prof, B1)
+        # Prepare excitation pulse: effective flip angle of shape (nlocs, 1)
+        fa = ((B1 * slice_prof) * flip)[..., None]
+        ca, sa = torch.cos(fa), torch.sin(fa)
 
         # Prepare relaxation operator for preparation pulse
         E1inv, rE1inv = epg.longitudinal_relaxation_op(R1, TI)
@@ -137,25 +133,22 @@ class MPnRAGEModel(AbstractModel):
         # Prepare relaxation operator for sequence loop
         E1, rE1 = epg.longitudinal_relaxation_op(R1, TR)
 
-        # Initialize signal
-        signal = []
-
-        # Apply inversion
-        states = epg.adiabatic_inversion(states, inv_efficiency)
-        states = epg.longitudinal_relaxation(states, E1inv, rE1inv)
-        states = epg.spoil(states)
-
-        # Scan loop
-        for p in range(nshots):
-
-            # Apply RF pulse
-            states = epg.rf_pulse(states, RF)
-
-            # Record signal
-            signal.append(epg.get_signal(states))
-
-            # Evolve
-            states = epg.longitudinal_relaxation(states, E1, rE1)
-            states = epg.spoil(states)
-
-        return M0 * 1j * torch.stack(signal)
+        # Apply inversion and recovery: starting from equilibrium (Z = 1, no
+        # transverse states), this is a single affine update of Z
+        Z = rE1inv - inv_efficiency * E1inv
+
+        # Scan loop: with spoiling, Z before each pulse follows the affine
+        # recurrence Z[p + 1] = E1 * cos(flip) * Z[p] + rE1, solved in closed form
+        # (A == 1, e.g., zero flip and TR, leaves Z unchanged)
+        A = E1 * ca
+        den = 1 - A
+        valid = den != 0
+        Zss = rE1 / torch.where(valid, den, torch.ones_like(den))
+        p = torch.arange(nshots, device=R1.device)[:, None, None]
+        Z = torch.where(valid, Zss + (Z - Zss) * A**p, Z)
+
+        # Record signal right after each pulse (1j * F+ = sin(flip) * Z, i.e.,
+        # real-valued), summed over pools and averaged over locations
+        signal = (sa * Z).sum(axis=-1).mean(axis=-1)
+
+        return M0 * signal
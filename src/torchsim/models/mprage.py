@@ -88,8 +88,6 @@ class MPRAGEModel(AbstractModel):
             Flip angle train in degrees.
         TRspgr : float
             Repetition time in milliseconds for each SPGR readout.
-        TRmprage : float
-            Repetition time in milliseconds for the whole inversion block.
         nshots : int | npt.ArrayLike
             Number of SPGR readout within the inversion block of shape ``(npre, npost)``
             If scalar, assume ``npre == npost == 0.5 * nshots``. Usually, this
@@ -97,12 +95,11 @@ class MPRAGEModel(AbstractModel):
             i.e., the number of slices divided by the total acceleration factor along ``z``.
 
         """
-        self.sequence.nshots = nshots
         self.sequence.TI = TI * 1e-3  # ms -> s
-        self.sequence.flip = torch.pi * flip / 180.0
+        self.sequence.flip = flip * (torch.pi / 180.0)
         self.sequence.TRspgr = TRspgr * 1e-3  # ms -> s
         if nshots.numel() == 1:
-            nshots = torch.repeat_interleave(nshots // 2, 2)
+            nshots = (nshots // 2).reshape(()).expand(2)
         self.sequence.nshots = nshots
 
     @staticmethod
@@ -111,24 +108,20 @@ class MPRAGEModel(AbstractModel):
         TI: npt.ArrayLike,
         flip: float | npt.ArrayLike,
         TRspgr: float,
-        TRmprage: float,
         nshots: int | npt.ArrayLike,
         M0: float | npt.ArrayLike = 1.0,
         inv_efficiency: float | npt.ArrayLike = 1.0,
     ):
-        R1 = 1e3 / T1
+        # s -> Hz with a single precision constant (keeps T1 tangents in float32)
+        scale = torch.as_tensor(1e3, device=T1.device)
+        R1 = scale / T1
 
         # Calculate number of shots and time before DC sampling
         nshots_bef = nshots[0]
         time_bef = nshots_bef * TRspgr
 
-        # Prepare EPG states matrix
-        states = epg.states_matrix(
-            device=R1.device,
-            nstates=1,
-        )
         # Prepare excitation pulse
-        RF = epg.rf_pulse_op(flip)
+        ca, sa = torch.cos(flip), torch.sin(flip)
 
         # Prepare relaxation operator for preparation pulse
         E1inv, rE1inv = epg.longitudinal_relaxation_op(R1, TI - time_bef)
@@ -136,20 +129,19 @@ class MPRAGEModel(AbstractModel):
         # Prepare relaxation operator for sequence loop
         E1, rE1 = epg.longitudinal_relaxation_op(R1, TRspgr)
 
-        # Apply inversion
-        states = epg.adiabatic_inversion(states, inv_efficiency)
-        states = epg.longitudinal_relaxation(states, E1inv, rE1inv)
-        states = epg.spoil(states)
-
-        # Scan loop
-        for p in range(nshots_bef):
-
-            # Apply RF pulse
-            states = epg.rf_pulse(states, RF)
-
-            # Evolve
-            states = epg.longitudinal_relaxation(states, E1, rE1)
-            states = epg.spoil(states)
-
-        # Record signal
-        return M0 * 1j * epg.get_signal(states)
+        # Apply inversion and recovery: starting from equilibrium (Z = 1, no
+        # transverse states), this is a single affine update of Z
+        Z = rE1inv - inv_efficiency * E1inv
+
+        # Scan loop: with spoiling, Z before each pulse follows the affine
+        # recurrence Z[p + 1] = E1 * cos(flip) * Z[p] + rE1, solved in closed form
+        # (A == 1, e.g., zero flip and TR, leaves Z unchanged)
+        A = E1 * ca
+        den = 1 - A
+        valid = den != 0
+        Zss = rE1 / torch.where(valid, den, torch.ones_like(den))
+        Z = torch.where(valid, Zss + (Z - Zss) * A**nshots_bef, Z)
+
+        # Record signal right after the RF pulse at k-space center: this is
+        # 1j * F+ = sin(flip) * Z, i.e., real-valued
+        return M0 * sa * Z
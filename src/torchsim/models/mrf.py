@@ -111,12 +111,12 @@ class MRFModel(AbstractModel):
             The default is ``1``.
 
         """
-        self.sequence.flip = torch.pi * flip / 180.0
+        self.sequence.flip = flip * (torch.pi / 180.0)
         self.sequence.TR = TR * 1e-3  # ms -> s
         self.sequence.TI = TI * 1e-3  # ms -> s
         self.sequence.slice_prof = slice_prof
-        self.sequence.nstates = nstates
-        self.sequence.nreps = nreps
+        self.sequence.nstates = int(nstates)  # loop/shape size: keep on host
+        self.sequence.nreps = int(nreps)  # loop/shape size: keep on host
 
     @staticmethod
     def _engine(
@@ -133,7 +133,8 @@ class MRFModel(AbstractModel):
         nreps: int = 1,
     ):
         # Prepare relaxation parameters
-        R1, R2 = 1e3 / T1, 1e3 / T2
+        scale = torch.as_tensor(1e3, device=T1.device)
+        R1, R2 = scale / T1, scale / T2
 
         # Prepare EPG states matrix
         states = epg.states_matrix(
@@ -145,34 +146,41 @@ class MRFModel(AbstractModel):
         # Prepare relaxation operator for preparation pulse
         E1inv, rE1inv = epg.longitudinal_relaxation_op(R1, TI)
 
+        # Fold (partial) inversion into the preparation decay: Z -> -eff * E1 * Z
+        E1inv = -inv_efficiency * E1inv
+
         # Prepare relaxation operator for sequence loop
         E1, rE1 = epg.longitudinal_relaxation_op(R1, TR)
         E2 = epg.transverse_relaxation_op(R2, TR)
 
+        # Prepare RF rotation operators for the whole flip angle train,
+        # split once into per-pulse (3, 3, nlocs, 1) views
+        RF = epg.rf_pulse_op(flip[:, None], slice_prof, B1).unbind(2)
+
         # Get number of shots
         nshots = len(flip)
 
         for r in range(nreps):
             signal = []
 
-            # Apply inversion
-            states = epg.adiabatic_inversion(states, inv_efficiency)
+            # Apply inversion and recovery
             states = epg.longitudinal_relaxation(states, E1inv, rE1inv)
             states = epg.spoil(states)
 
             # Scan loop
             for p in range(nshots):
-                RF = epg.rf_pulse_op(flip[p], slice_prof, B1)
-
                 # Apply RF pulse
-                states = epg.rf_pulse(states, RF)
+                states = epg.rf_pulse(states, RF[p])
 
-                # Record signal
-                signal.append(epg.get_signal(states))
+                # Record (unreduced) signal
+                signal.append(states.Fplus[0])
 
                 # Evolve
-                states = epg.longitudinal_relaxation(states, E1, rE1)
-                states = epg.transverse_relaxation(states, E2)
-                states = epg.shift(states)
+                states = epg.evolve(states, E1, rE1, E2)
+
+        # Reduce signal for the whole train (as epg.get_signal): sum over pools
+        # and average over locations
+        signal = torch.stack(signal).sum(axis=-1).mean(axis=-1)
 
-        return M0 * 1j * torch.stack(signal)
+        # Pulses are unphased, hence F+ is imaginary and 1j * F+ is real
+        return -M0 * signal.imag
@@ -94,7 +94,7 @@ class SPGRModel(AbstractModel):
             Echo time in milliseconds.
 
         """
-        self.sequence.flip = torch.pi * flip / 180.0
+        self.sequence.flip = flip * (torch.pi / 180.0)
         self.sequence.TR = TR * 1e-3  # ms -> s
         self.sequence.TE = TE * 1e-3  # ms -> s
 
@@ -110,7 +110,8 @@ class SPGRModel(AbstractModel):
         chemshift: float | npt.ArrayLike = 0.0,
     ):
         # Prepare relaxation parameters
-        R1, R2star = 1e3 / T1, 1e3 / T2star
+        scale = torch.as_tensor(1e3, device=T1.device)
+        R1, R2star = scale / T1, scale / T2star
 
         # We are assuming Freeman-Hill convention for off-resonance map,
         # so we need to negate to make use with this Ernst-Anderson-based implementation from Hoff
@@ -119,7 +120,7 @@ class SPGRModel(AbstractModel):
         # Prepare off resonance
         df = 2 * torch.pi * (B0 + chemshift)
 
-        # Divide-by-zero risk with PyTorch's nan_to_num
+        # Prepare relaxation operators
         E1 = torch.exp(-R1 * TR)
         E2 = torch.exp(-R2star * TE)
         Phi = torch.exp(1j * df * TE)
@@ -130,7 +131,9 @@ class SPGRModel(AbstractModel):
 
         # Main calculation
         den = 1 - E1 * ca
-        Mxy = M0 * ((1 - E1) * sa) / den
+        valid = den != 0
+        safe_den = torch.where(valid, den, 1.0)  # keep masked gradients finite
+        Mxy = M0 * torch.where(valid, ((1 - E1) * sa) / safe_den, 0.0)
 
         # Add decay
         signal = Mxy * E2
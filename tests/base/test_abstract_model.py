@@ -60,3 +60,36 @@ def test_call():
     # Test that the __call__ method returns both outputs
     assert isinstance(output, torch.Tensor)
     assert isinstance(jacobian_output, torch.Tensor)
+
+
+# Test engines are reused across calls with the same sequence
+def test_call_reuses_engines():
+    model = MyModel(chunk_size=10, diff="param")
+    model.set_properties(torch.tensor([1.0]))
+
+    model()
+    engines = model._engines
+    model.set_properties(torch.tensor([2.0]))
+    model()
+
+    assert model._engines is engines
+
+
+# Test __call__ leaves the sequence untouched
+def test_call_keeps_sequence():
+    class MySequenceModel(MyModel):
+        def set_sequence(self, scale):
+            self.sequence.scale = scale
+
+        @staticmethod
+        def _engine(param, scale=1.0):
+            return scale * torch.tensor([1.0, 2.0, 3.0])
+
+    model = MySequenceModel(chunk_size=10, device="cpu", diff="param")
+    model.set_properties(torch.tensor([1.0]))
+    scale = torch.tensor(2.0)
+    model.set_sequence(scale)
+
+    model()
+
+    assert model.sequence.scale is scale
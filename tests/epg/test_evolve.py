@@ -0,0 +1,54 @@
+"""Test free precession operator."""
+
+import torch
+from types import SimpleNamespace
+
+from torchsim import epg
+
+
+def _sample_states():
+    nstates, nlocs, npools = 5, 3, 1
+    Fplus = torch.randn((nstates, nlocs, npools), dtype=torch.complex64)
+    Fminus = torch.randn((nstates, nlocs, npools), dtype=torch.complex64)
+    Z = torch.randn((nstates, nlocs, npools), dtype=torch.complex64)
+    return SimpleNamespace(Fplus=Fplus, Fminus=Fminus, Z=Z)
+
+
+def test_evolve_matches_sequential_operators():
+    states = _sample_states()
+    reference = SimpleNamespace(**{k: v.clone() for k, v in vars(states).items()})
+
+    E1, rE1 = epg.longitudinal_relaxation_op(torch.tensor(1.0), torch.tensor(0.01))
+    E2 = epg.transverse_relaxation_op(torch.tensor(10.0), torch.tensor(0.01))
+
+    # Expected results
+    reference = epg.longitudinal_relaxation(reference, E1, rE1)
+    reference = epg.transverse_relaxation(reference, E2)
+    reference = epg.shift(reference)
+
+    evolved = epg.evolve(states, E1, rE1, E2)
+
+    assert torch.allclose(evolved.Fplus, reference.Fplus, atol=1e-6)
+    assert torch.allclose(evolved.Fminus, reference.Fminus, atol=1e-6)
+    assert torch.allclose(evolved.Z, reference.Z, atol=1e-6)
+
+
+def test_evolve_shift_first():
+    states = _sample_states()
+    reference = SimpleNamespace(**{k: v.clone() for k, v in vars(states).items()})
+
+    # Real, state-independent transverse relaxation commutes with the shift
+    E1, rE1 = torch.tensor(0.9), torch.tensor(0.1)
+    E2 = torch.tensor(0.8)
+
+    # Expected results
+    reference = epg.shift(reference)
+    reference = epg.longitudinal_relaxation(reference, E1, rE1)
+    reference = epg.transverse_relaxation(reference, E2)
+
+    evolved = epg.evolve(states, E1, rE1, E2)
+
+    assert evolved is states
+    assert torch.allclose(evolved.Fplus, reference.Fplus, atol=1e-6)
+    assert torch.allclose(evolved.Fminus, reference.Fminus, atol=1e-6)
+    assert torch.allclose(evolved.Z, reference.Z, atol=1e-6)
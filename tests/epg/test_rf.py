@@ -39,6 +39,9 @@ def test_rf_pulse_op():
     assert len(RF) == 3
     assert len(RF[0]) == 3
     assert isinstance(RF[0][0], torch.Tensor)
+    assert RF.shape == (3, 3, 1)
+    assert torch.allclose(RF[2, 2].real, torch.cos(B1 * fa))
+    assert torch.allclose(RF[0, 2].imag, -torch.sin(B1 * fa))
 
 
 def test_phased_rf_pulse_op():
@@ -53,6 +56,26 @@ def test_phased_rf_pulse_op():
     assert len(RF) == 3
     assert len(RF[0]) == 3
     assert isinstance(RF[0][0], torch.Tensor)
+    assert torch.allclose(RF[1, 0], RF[0, 1].conj())
+    ep, sa = torch.exp(1j * (phi + B1phase)), torch.sin(B1 * fa)
+    assert torch.allclose(RF[0, 1], ep**2 * torch.sin(0.5 * B1 * fa) ** 2)
+    assert torch.allclose(RF[0, 2], -1j * ep * sa)
+    assert torch.allclose(RF[2, 0], -0.5j * ep.conj() * sa)
+
+
+def test_rf_pulse_op_jacobian_dtype():
+    fa = torch.tensor(0.5)
+    phi = torch.tensor(0.2)
+    B1 = torch.tensor(0.9)
+
+    def _rf(B1):
+        return torch.view_as_real(epg.rf_pulse_op(fa, B1=B1))
+
+    def _phased_rf(B1):
+        return torch.view_as_real(epg.phased_rf_pulse_op(fa, phi, B1=B1))
+
+    assert torch.func.jacfwd(_rf)(B1).dtype == torch.float32
+    assert torch.func.jacfwd(_phased_rf)(B1).dtype == torch.float32
 
 
 def test_multidrive_rf_pulse_op():
@@ -92,6 +115,16 @@ def test_initialize_mt_sat():
     WT = epg.initialize_mt_sat(duration, b1rms, df, slice_prof, B1)
 
     assert isinstance(WT, torch.Tensor)
+    assert WT.dtype == torch.float32
+
+
+def test_initialize_mt_sat_double_input():
+    duration = torch.tensor(0.001, dtype=torch.float64)  # 1 ms
+    b1rms = torch.tensor(0.05, dtype=torch.float64)  # Tesla
+
+    WT = epg.initialize_mt_sat(duration, b1rms)
+
+    assert WT.dtype == torch.float32
 
 
 def test_mt_sat_op():
@@ -127,6 +160,25 @@ def test_rf_pulse(states_fixture, RF_fixture):
     assert torch.allclose(states_out.Z, states.Z)
 
 
+def test_rf_pulse_stacked_operator():
+    fa = torch.tensor(0.5)
+    RF = epg.rf_pulse_op(fa)
+    RF_list = [[RF[i][j] for j in range(3)] for i in range(3)]
+
+    Fplus = torch.randn(4, 1, 1, dtype=torch.complex64)
+    Fminus = torch.randn(4, 1, 1, dtype=torch.complex64)
+    Z = torch.randn(4, 1, 1, dtype=torch.complex64)
+
+    states = SimpleNamespace(Fplus=Fplus, Fminus=Fminus, Z=Z)
+    expected = SimpleNamespace(Fplus=Fplus, Fminus=Fminus, Z=Z)
+    states_out = epg.rf_pulse(states, RF)
+    expected = epg.rf_pulse(expected, RF_list)
+
+    assert torch.allclose(states_out.Fplus, expected.Fplus)
+    assert torch.allclose(states_out.Fminus, expected.Fminus)
+    assert torch.allclose(states_out.Z, expected.Z)
+
+
 def test_mt_sat(states_fixture):
     states = states_fixture
     Z = states.Z.clone()
@@ -3,6 +3,7 @@
 from pytest import fixture
 
 import numpy as np
+import torch
 from torchsim import fse_sim
 
 
@@ -29,6 +30,10 @@ def test_scalar_derivative(flip):
 def test_multiple_derivative(flip):
     _, dsig = fse_sim(flip, ESP=1.0, T1=(200, 500, 1000.0), T2=100.0, diff="T1")
     assert dsig.shape == (3, 100)
+    assert dsig.dtype == torch.complex64
+    _, dsig = fse_sim(flip, ESP=1.0, T1=1000.0, T2=100.0, B1=(0.9, 1.0, 1.1), diff="B1")
+    assert dsig.shape == (3, 100)
+    assert dsig.dtype == torch.complex64
 
 
 def test_scalar_gradient(flip):
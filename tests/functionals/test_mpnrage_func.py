@@ -1,5 +1,6 @@
 """MPnRAGE tests."""
 
+import numpy as np
 from torchsim import mpnrage_sim
 
 
@@ -23,3 +24,17 @@ def test_multiple_derivative():
         nshots=100, flip=5.0, TR=10.0, T1=(200, 500, 1000.0), diff="T1"
     )
     assert dsig.shape == (3, 100)
+
+
+def test_zero_denominator():
+    sig, dsig = mpnrage_sim(nshots=100, flip=0.0, TR=0.0, T1=1000.0, diff="T1")
+    assert (sig == 0).all()
+    assert np.isfinite(dsig).all()
+
+
+def test_steady_state():
+    sig = mpnrage_sim(nshots=1000, flip=5.0, TR=10.0, T1=1000.0)
+    E1 = np.exp(-10.0 / 1000.0)
+    fa = np.deg2rad(5.0)
+    expected = np.sin(fa) * (1 - E1) / (1 - E1 * np.cos(fa))
+    np.testing.assert_allclose(abs(sig[-1]), expected, rtol=1e-4)
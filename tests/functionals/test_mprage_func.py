@@ -1,5 +1,7 @@
 """MPRAGE tests."""
 
+import numpy as np
+import torch
 from torchsim import mprage_sim
 
 
@@ -23,3 +25,50 @@ def test_multiple_forward():
         T1=(200, 500, 1000.0),
     )
     assert sig.shape == (3,)
+
+
+def test_scalar_derivative():
+    _, dsig = mprage_sim(
+        nshots=100,
+        TI=200.0,
+        flip=5.0,
+        TRspgr=10.0,
+        T1=1000.0,
+        diff="T1",
+    )
+    assert dsig.shape == ()
+    assert dsig.dtype == torch.float32
+
+
+def test_signal():
+    sig = mprage_sim(
+        nshots=100,
+        TI=800.0,
+        flip=5.0,
+        TRspgr=10.0,
+        T1=1000.0,
+    )
+
+    # reference: inversion, recovery until first readout, then 50 spoiled shots
+    fa = np.deg2rad(5.0)
+    E1 = np.exp(-10.0 / 1000.0)
+    Einv = np.exp(-(800.0 - 500.0) / 1000.0)
+    Z = -1.0 * Einv + 1 - Einv
+    for n in range(50):
+        Z = E1 * np.cos(fa) * Z + 1 - E1
+    expected = np.sin(fa) * Z
+
+    np.testing.assert_allclose(sig, expected, rtol=1e-4)
+
+
+def test_zero_denominator():
+    sig, dsig = mprage_sim(
+        nshots=100,
+        TI=200.0,
+        flip=0.0,
+        TRspgr=0.0,
+        T1=1000.0,
+        diff="T1",
+    )
+    assert sig == 0
+    assert np.isfinite(dsig).all()
@@ -21,6 +21,12 @@ def test_multiple_forward(flip):
     assert sig.shape == (3, 100)
 
 
+def test_real_output(flip):
+    sig, dsig = mrf_sim(flip, TR=10.0, T1=1000.0, T2=100.0, diff="T1")
+    assert not sig.is_complex()
+    assert not dsig.is_complex()
+
+
 def test_scalar_derivative(flip):
     _, dsig = mrf_sim(flip, TR=10.0, T1=1000.0, T2=100.0, diff="T1")
     assert dsig.shape == (100,)
@@ -29,6 +35,8 @@ def test_scalar_derivative(flip):
 def test_multiple_derivative(flip):
     _, dsig = mrf_sim(flip, TR=10.0, T1=(200, 500, 1000.0), T2=100.0, diff="T1")
     assert dsig.shape == (3, 100)
+    _, dsig = mrf_sim(flip, TR=10.0, T1=1000.0, T2=100.0, B1=(0.9, 1.0, 1.1), diff="B1")
+    assert dsig.shape == (3, 100)
 
 
 def test_scalar_gradient(flip):
@@ -39,3 +47,14 @@ def test_scalar_gradient(flip):
 def test_multiple_gradient(flip):
     _, grad = mrf_sim(flip, TR=10.0, T1=(200, 500, 1000.0), T2=100.0, diff=("T1", "T2"))
     assert grad.shape == (3, 2, 100)
+
+
+def test_shared_scalar_forward(flip):
+    sig = mrf_sim(flip, TR=10.0, T1=(200, 500, 1000.0), T2=100.0)
+    ref = mrf_sim(flip, TR=10.0, T1=(200, 500, 1000.0), T2=(100.0, 100.0, 100.0))
+    np.testing.assert_allclose(sig, ref, rtol=1e-5, atol=1e-6)
+
+
+def test_singleton_broadcast_forward(flip):
+    sig = mrf_sim(flip, TR=10.0, T1=(1000.0,), T2=100.0, B1=(1.0, 0.9, 0.8))
+    assert sig.shape == (3, 100)
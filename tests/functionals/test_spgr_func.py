@@ -4,6 +4,7 @@ from pytest import fixture
 
 import numpy as np
 from torchsim import spgr_sim
+from torchsim.models import SPGRModel
 
 
 @fixture
@@ -26,6 +27,32 @@ def test_multiple_forward(flip):
     assert sig.shape == (3, 100)
 
 
+def test_zero_denominator():
+    sig = spgr_sim(0.0, TE=2.0, TR=0.0, T1=1000.0, T2star=100.0)
+    assert (sig == 0).all()
+
+
+def test_zero_denominator_derivative():
+    _, dsig = spgr_sim(0.0, TE=2.0, TR=0.0, T1=1000.0, T2star=100.0, diff="T1")
+    assert np.isfinite(dsig).all()
+
+
+def test_off_resonance_output(flip):
+    sig = spgr_sim(flip, TE=2.0, TR=10.0, T1=1000.0, T2star=100.0, B0=10.0)
+    assert sig.is_complex()
+
+
+def test_off_resonance_forward():
+    model = SPGRModel()
+    model.set_properties(T1=1000.0, T2star=100.0)
+    model.set_sequence(flip=5.0, TR=10.0, TE=2.0)
+    sig = model.forward()(1000.0, 100.0, 1.0, B0=50.0)
+
+    expected = spgr_sim(5.0, TE=2.0, TR=10.0, T1=1000.0, T2star=100.0, B0=50.0)
+    assert sig.is_complex()
+    np.testing.assert_allclose(sig, expected, rtol=1e-5)
+
+
 def test_scalar_derivative(flip):
     _, dsig = spgr_sim(flip, TE=2.0, TR=10.0, T1=1000.0, T2star=100.0, diff="T1")
     assert dsig.shape == (100,)